@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import re
+import threading
 from datetime import date
+from enum import Enum
+from io import BytesIO
 from typing import Dict, List, Optional, Tuple
 
-import requests
-from fastapi import FastAPI, HTTPException, Query
-from lxml import html
+import httpx
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from lxml import etree, html
+from lxml.cssselect import CSSSelector
+from lxml.etree import XPath
 
 
 # =========================
@@ -20,80 +28,143 @@ MEAL_XPATHS_A = [
     ("석식", '//*[@id="contents"]/div/div[2]/table/tbody/tr[3]/td'),
 ]
 
+A_MEAL_KEYS = tuple(name for name, _ in MEAL_XPATHS_A)
+
+
+class Meal(str, Enum):
+    """A쪽 meal 파라미터. 잘못된 값은 Pydantic이 코드 진입 전에 422로 거른다."""
+
+    breakfast = "조식"
+    lunch = "중식"
+    dinner = "석식"
+
 
 def build_url_a(y: int, m: int, d: int) -> str:
     return f"{BASE_URL_A}?year={y}&month={m}&date={d}"
 
 
-def fetch_html_text(url: str) -> str:
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept-Language": "ko-KR,ko;q=0.9",
-    }
-    r = requests.get(url, headers=headers, timeout=(3, 10))
-    r.raise_for_status()
+# 매 요청마다 새 TCP/TLS 연결을 맺지 않도록 커넥션 풀이 있는 클라이언트를 공유.
+# 이벤트 루프가 필요하므로 앱 startup에서 생성한다.
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
 
-    # A쪽은 EUC-KR/CP949일 수 있어서 폴백 유지
-    for enc in ("euc-kr", "cp949", "utf-8"):
-        try:
-            return r.content.decode(enc)
-        except UnicodeDecodeError:
-            continue
-    return r.content.decode("utf-8", errors="replace")
+# 식단은 하루에 한 번 바뀔까 말까 하므로 파싱 결과를 잠시 캐시
+CACHE_TTL_SECONDS = 300
+_A_CACHE: TTLCache = TTLCache(maxsize=512, ttl=CACHE_TTL_SECONDS)
+_A_CACHE_LOCK = threading.Lock()
+_B_CACHE: TTLCache = TTLCache(maxsize=16, ttl=CACHE_TTL_SECONDS)
+_B_CACHE_LOCK = threading.Lock()
+
+# 캐시 미스가 동시에 몰려도 같은 키의 업스트림 요청은 한 번만 나가도록
+# (single-flight). 이벤트 루프 한 개 안에서만 건드리므로 락은 불필요.
+_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+
+async def _single_flight(key: tuple, fetch):
+    """
+    key가 이미 날아가는 중이면 그 결과를 기다리고,
+    아니면 직접 fetch()를 수행해 대기자들에게 결과(또는 예외)를 전달한다.
+    """
+    fut = _INFLIGHT.get(key)
+    if fut is not None:
+        return await fut
+
+    fut = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = fut
+    try:
+        result = await fetch()
+    except BaseException as e:
+        fut.set_exception(e)
+        fut.exception()  # 대기자가 없어도 'never retrieved' 경고 방지
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        _INFLIGHT.pop(key, None)
+
+
+# 바이트를 그대로 넘기면 libxml2가 C 레벨에서 한 번에 디코드한다.
+# (A쪽은 EUC-KR/CP949, B쪽은 iterparse에 encoding="utf-8"로 전달)
+# remove_comments/remove_pis로 트리를 줄여 이후 XPath 탐색도 가벼워진다.
+#
+# HTMLParser는 스레드 간 공유가 안 되므로(파싱은 to_thread 풀에서 돈다)
+# 스레드마다 하나씩 만들어 재사용한다.
+_TLS = threading.local()
+
+
+def _a_parser() -> html.HTMLParser:
+    p = getattr(_TLS, "a_parser", None)
+    if p is None:
+        p = _TLS.a_parser = html.HTMLParser(
+            encoding="euc-kr", remove_comments=True, remove_pis=True
+        )
+    return p
+
+
+async def fetch_bytes_async(url: str) -> bytes:
+    assert ASYNC_CLIENT is not None, "AsyncClient not initialised (app startup)"
+    r = await ASYNC_CLIENT.get(url)
+    r.raise_for_status()
+    return r.content
 
 
 def xpath_without_tbody(xpath: str) -> str:
     return xpath.replace("/tbody", "")
 
 
-def extract_by_xpath(tree, xpath: str):
-    nodes = tree.xpath(xpath)
-    if not nodes:
-        nodes = tree.xpath(xpath_without_tbody(xpath))
-    return nodes
+# XPath를 매 요청마다 재파싱하지 않도록 import 시점에 한 번만 컴파일
+# (브라우저가 끼워넣는 tbody가 실제 HTML에 없을 수 있어 폴백도 같이 컴파일)
+A_SELECTORS = {
+    name: (XPath(xp), XPath(xpath_without_tbody(xp)))
+    for name, xp in MEAL_XPATHS_A
+}
 
 
 def extract_td_lines_preserve_br(td) -> List[str]:
     """
     <br> 기준 줄바꿈 보존 + tail 포함 (텍스트 손실 방지)
-    """
-    parts: List[str] = []
-
-    if td.text:
-        parts.append(td.text)
 
-    for child in td:
-        if isinstance(child.tag, str) and child.tag.lower() == "br":
-            parts.append("\n")
+    <br>의 tail 앞에 '\\n'을 심어두면 text_content()가 C 레벨에서
+    줄바꿈이 보존된 전체 텍스트를 한 번에 만들어 준다.
+    """
+    for br in td.iter("br"):
+        br.tail = "\n" + (br.tail or "")
 
-        if child.text:
-            parts.append(child.text)
+    text = td.text_content().replace("\xa0", " ")
+    return _LINE_RE.findall(text)
 
-        if child.tail:
-            parts.append(child.tail)
 
-    text = "".join(parts).replace("\xa0", " ")
-    lines = [line.strip() for line in text.split("\n")]
-    return [line for line in lines if line]
+def parse_a_content(content: bytes) -> Dict[str, List[str]]:
+    tree = html.fromstring(content, parser=_a_parser())
 
+    _lines = extract_td_lines_preserve_br  # 루프 안 모듈 조회 생략
+    return {
+        name: [line for td in (primary(tree) or fallback(tree)) for line in _lines(td)]
+        for name, (primary, fallback) in A_SELECTORS.items()
+    }
 
-def parse_page_a(y: int, m: int, d: int) -> Dict[str, List[str]]:
-    url = build_url_a(y, m, d)
-    html_text = fetch_html_text(url)
-    tree = html.fromstring(html_text)
 
-    result: Dict[str, List[str]] = {}
+async def _fetch_and_parse_a(y: int, m: int, d: int) -> Dict[str, List[str]]:
+    content = await fetch_bytes_async(build_url_a(y, m, d))
+    # lxml 파싱은 CPU 작업이라 이벤트 루프를 막지 않게 스레드로 넘긴다
+    result = await asyncio.to_thread(parse_a_content, content)
 
-    for meal_name, xp in MEAL_XPATHS_A:
-        tds = extract_by_xpath(tree, xp)
+    with _A_CACHE_LOCK:
+        _A_CACHE[(y, m, d)] = result
+    return result
 
-        meal_items: List[str] = []
-        for td in tds:
-            meal_items.extend(extract_td_lines_preserve_br(td))
 
-        result[meal_name] = meal_items
+async def parse_page_a(y: int, m: int, d: int) -> Dict[str, List[str]]:
+    with _A_CACHE_LOCK:
+        hit = _A_CACHE.get((y, m, d))
+    if hit is not None:
+        return hit
 
-    return result
+    return await _single_flight(("a", y, m, d), lambda: _fetch_and_parse_a(y, m, d))
 
 
 # =========================
@@ -114,29 +185,53 @@ DAY_TO_DIV_ID = {
 B_MEAL_KEYS = ("아침", "점심", "저녁")
 
 
-def normalize_space(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+class Day(str, Enum):
+    """B쪽 day 파라미터 (mon|tue|...|sun)"""
 
+    mon = "mon"
+    tue = "tue"
+    wed = "wed"
+    thu = "thu"
+    fri = "fri"
+    sat = "sat"
+    sun = "sun"
 
-def extract_text_preserve_br(node) -> str:
+DIV_ID_TO_DAY = {div_id: day for day, div_id in DAY_TO_DIV_ID.items()}
+
+# B쪽 셀렉터도 전부 import 시점에 컴파일.
+# CSS 셀렉터는 id/클래스 하강을 C 레벨 탐색 한 번으로 합쳐 준다.
+H3_CSS = CSSSelector("h3")
+TBL4_CSS = CSSSelector("table.tbl_4")
+ANY_TABLE_CSS = CSSSelector("table")
+
+
+# 줄 단위 split + strip + 빈 줄 제거를 C 레벨 한 번의 패스로:
+# 줄 내부 공백은 보존하면서 앞뒤 공백과 빈 줄만 걸러낸다.
+_LINE_RE = re.compile(r"[^\r\n\t\f\v ]+(?:[ \t]+[^\r\n\t\f\v ]+)*")
+
+
+def element_text(node) -> str:
     """
-    node 내부의 <br>를 '\n'으로 보존해 텍스트 구성
+    text_content()와 같은 C 레벨 텍스트 추출.
+    iterparse(html=True)는 HtmlElement가 아닌 _Element를 주기 때문에
+    text_content() 대신 tostring(method="text")를 쓴다.
     """
-    parts: List[str] = []
-    if node.text:
-        parts.append(node.text)
+    return etree.tostring(node, method="text", encoding="unicode", with_tail=False)
 
-    for child in node:
-        if isinstance(child.tag, str) and child.tag.lower() == "br":
-            parts.append("\n")
 
-        if child.text:
-            parts.append(child.text)
+def normalize_space(s: str) -> str:
+    # re.sub(r"\s+", " ", s).strip()와 동일하지만 C 구현 str.split이 더 빠름
+    return " ".join(s.split())
 
-        if child.tail:
-            parts.append(child.tail)
 
-    return "".join(parts).replace("\xa0", " ").strip()
+def extract_text_preserve_br(node) -> str:
+    """
+    node 내부의 <br>를 '\n'으로 보존해 텍스트 구성 (C 레벨 text_content 사용)
+    """
+    for br in node.iter("br"):
+        br.tail = "\n" + (br.tail or "")
+
+    return element_text(node).replace("\xa0", " ").strip()
 
 
 def parse_b_date_from_h3(h3_text: str) -> Optional[str]:
@@ -155,6 +250,23 @@ def parse_b_date_from_h3(h3_text: str) -> Optional[str]:
     return f"{yy:04d}-{mm:02d}-{dd:02d}"
 
 
+def is_time_range_token(token: str) -> bool:
+    """
+    "[11:00~14:00]" 모양인지 정규식 없이 고정 위치 검사로 판별
+    """
+    s = token.strip("[]")
+    return (
+        len(s) == 11
+        and s[2] == ":"
+        and s[5] == "~"
+        and s[8] == ":"
+        and s[:2].isdigit()
+        and s[3:5].isdigit()
+        and s[6:8].isdigit()
+        and s[9:].isdigit()
+    )
+
+
 def strip_prefix_by_tokens(line: str) -> str:
     """
     띄어쓰기 기준 후처리 (형식 변화에 대한 내성 포함)
@@ -167,8 +279,8 @@ def strip_prefix_by_tokens(line: str) -> str:
     if not tokens:
         return ""
 
-    # [11:00~14:00] 같은 시간 토큰 제거(대략적 판별)
-    if tokens and tokens[0].startswith("[") and tokens[0].endswith("]") and "~" in tokens[0]:
+    # [11:00~14:00] 같은 시간 토큰 제거
+    if tokens[0].startswith("[") and tokens[0].endswith("]") and is_time_range_token(tokens[0]):
         tokens = tokens[1:]
 
     # [느티헌] 같은 대괄호 토큰 제거
@@ -178,39 +290,24 @@ def strip_prefix_by_tokens(line: str) -> str:
     return " ".join(tokens).strip()
 
 
-def parse_page_b(day: str) -> Tuple[Optional[str], Dict[str, List[str]]]:
+def parse_b_section(day_div) -> Tuple[Optional[str], Dict[str, List[str]]]:
     """
-    day: mon|tue|... 로 요청받고,
-    해당 요일 div에서 '교직원 식당' 테이블을 찾아 아침/점심/저녁을 파싱
+    요일 div에서 '교직원 식당' 테이블을 찾아 아침/점심/저녁을 파싱
     """
-    if day not in DAY_TO_DIV_ID:
-        raise ValueError("day must be one of: mon, tue, wed, thu, fri, sat, sun")
-
-    html_text = fetch_html_text(BASE_URL_B)
-    tree = html.fromstring(html_text)
-
-    div_id = DAY_TO_DIV_ID[day]
-
-    # 1) 요일 div 찾기
-    day_divs = tree.xpath(f'//div[@id="{div_id}"]')
-    if not day_divs:
-        raise RuntimeError(f"Cannot find day div: {div_id}")
-    day_div = day_divs[0]
-
-    # 2) '교직원 식당' h3 찾기
-    h3_nodes = day_div.xpath(
-        './/h3[contains(normalize-space(.), "교직원") and contains(normalize-space(.), "식당")]'
-    )
-    if not h3_nodes:
+    # 1) '교직원 식당' h3 찾기 (텍스트 필터는 Python에서, h3는 몇 개 안 됨)
+    h3_text: Optional[str] = None
+    for h3 in H3_CSS(day_div):
+        text = normalize_space(element_text(h3))
+        if "교직원" in text and "식당" in text:
+            h3_text = text
+            break
+    if h3_text is None:
         raise RuntimeError("Cannot find '교직원 식당' section (h3).")
 
-    h3_text = normalize_space(h3_nodes[0].text_content())
     parsed_date = parse_b_date_from_h3(h3_text)
 
     # 3) h3 아래(같은 div 내부)에서 첫 번째 table(tbl_4)을 우선 사용
-    tables = day_div.xpath('.//table[contains(@class,"tbl_4")]')
-    if not tables:
-        tables = day_div.xpath(".//table")
+    tables = TBL4_CSS(day_div) or ANY_TABLE_CSS(day_div)
     if not tables:
         raise RuntimeError("Cannot find menu table in the '교직원 식당' section.")
 
@@ -218,25 +315,21 @@ def parse_page_b(day: str) -> Tuple[Optional[str], Dict[str, List[str]]]:
 
     # 4) 행 파싱: <tr><th scope="row">점심</th><td>...</td></tr>
     out: Dict[str, List[str]] = {k: [] for k in B_MEAL_KEYS}
-    rows = table.xpath(".//tr")
-    for tr in rows:
-        ths = tr.xpath("./th")
-        tds = tr.xpath("./td")
-        if not ths or not tds:
+    for tr in table.iter("tr"):
+        # 단순 자식 탐색은 XPath 엔진보다 가벼운 ElementPath(find)로
+        th = tr.find("th")
+        td = tr.find("td")
+        if th is None or td is None:
             continue
 
-        key = normalize_space(ths[0].text_content())
+        key = normalize_space(element_text(th))
         if key not in out:
             continue
 
-        td_text = extract_text_preserve_br(tds[0])
+        td_text = extract_text_preserve_br(td)
 
         cleaned_lines: List[str] = []
-        for raw_line in td_text.split("\n"):
-            raw_line = raw_line.strip()
-            if not raw_line:
-                continue
-
+        for raw_line in _LINE_RE.findall(td_text):
             # 여기서 "[11:00~14:00] [느티헌]" 등 앞부분 제거
             menu_line = strip_prefix_by_tokens(raw_line)
             if menu_line:
@@ -247,6 +340,80 @@ def parse_page_b(day: str) -> Tuple[Optional[str], Dict[str, List[str]]]:
     return parsed_date, out
 
 
+def parse_b_all_days(
+    content: bytes,
+) -> Tuple[
+    Dict[str, Tuple[Optional[str], Dict[str, List[str]]]], Dict[str, RuntimeError]
+]:
+    """
+    iterparse로 페이지를 스트리밍 파싱해 7일치 결과를 전부 뽑는다.
+    요일 div는 결과를 뽑은 즉시 clear()해서 전체 DOM 대신 요일 하나
+    수준으로 peak 메모리를 묶는다.
+    (성공한 요일 dict, 실패한 요일의 예외 dict)를 돌려준다.
+    """
+    results: Dict[str, Tuple[Optional[str], Dict[str, List[str]]]] = {}
+    errors: Dict[str, RuntimeError] = {}
+
+    for _event, elem in etree.iterparse(
+        BytesIO(content),
+        events=("end",),
+        tag="div",
+        html=True,
+        encoding="utf-8",
+        remove_comments=True,
+        remove_pis=True,
+    ):
+        day = DIV_ID_TO_DAY.get(elem.get("id", ""))
+        if day is None:
+            continue
+
+        try:
+            results[day] = parse_b_section(elem)
+        except RuntimeError as e:
+            errors[day] = e
+
+        # 추출이 끝난 서브트리는 즉시 해제 (fast_iter 패턴)
+        elem.clear(keep_tail=True)
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    return results, errors
+
+
+async def _fetch_and_parse_b():
+    content = await fetch_bytes_async(BASE_URL_B)
+    results, errors = await asyncio.to_thread(parse_b_all_days, content)
+
+    with _B_CACHE_LOCK:
+        for d, res in results.items():
+            _B_CACHE[d] = res
+    return results, errors
+
+
+async def parse_page_b(day: str) -> Tuple[Optional[str], Dict[str, List[str]]]:
+    """
+    day: mon|tue|... 로 요청받고, 캐시 미스일 때만 페이지를 가져와 파싱.
+    한 번의 fetch+파싱으로 7일치를 모두 캐시에 채워 두고, 동시에 터지는
+    미스는 single-flight로 한 번의 업스트림 요청에 합쳐진다.
+    """
+    if day not in DAY_TO_DIV_ID:
+        raise ValueError("day must be one of: mon, tue, wed, thu, fri, sat, sun")
+
+    with _B_CACHE_LOCK:
+        hit = _B_CACHE.get(day)
+    if hit is not None:
+        return hit
+
+    results, errors = await _single_flight(("b",), _fetch_and_parse_b)
+    if day in results:
+        return results[day]
+    if day in errors:
+        raise errors[day]
+    raise RuntimeError(f"Cannot find day div: {DAY_TO_DIV_ID[day]}")
+
+
 # =========================
 # FastAPI
 # =========================
@@ -254,76 +421,89 @@ app = FastAPI(
     title="KNUE Meal API",
     version="1.1.0",
     description="A: 사도교육원 식단 / B: pot.knue 교직원식당(요일별) 식단",
+    default_response_class=ORJSONResponse,
 )
 
 
+@app.on_event("startup")
+async def _startup() -> None:
+    global ASYNC_CLIENT
+    ASYNC_CLIENT = httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        http2=True,
+        follow_redirects=True,
+    )
+
+
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    if ASYNC_CLIENT is not None:
+        await ASYNC_CLIENT.aclose()
+
+
+# 응답이 상수라 매번 직렬화하지 않고 미리 만들어 둔 Response를 재사용
+_HEALTH_RESPONSE = Response(content=b'{"ok":true}', media_type="application/json")
+
+
 @app.get("/health")
 def health():
-    return {"ok": True}
+    return _HEALTH_RESPONSE
 
 
 # ---- meals-A (기존 엔드포인트 유지) ----
 @app.get("/meals-a")
-def get_meals_a(
+async def get_meals_a(
     y: int = Query(..., ge=2000, le=2100, description="연도 (예: 2025)"),
     m: int = Query(..., ge=1, le=12, description="월 (1~12)"),
     d: int = Query(..., ge=1, le=31, description="일 (1~31)"),
-    meal: Optional[str] = Query(None, description="특정 식사만 조회 (조식|중식|석식). 미지정 시 전체 반환"),
+    meal: Optional[Meal] = Query(None, description="특정 식사만 조회 (조식|중식|석식). 미지정 시 전체 반환"),
 ):
+    # ISO 문자열은 한 번만 만들고, 달력 검증도 C 구현인 fromisoformat으로
+    iso = f"{y:04d}-{m:02d}-{d:02d}"
     try:
-        _ = date(y, m, d)
+        date.fromisoformat(iso)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date (y, m, d)")
 
     try:
-        data = parse_page_a(y, m, d)
-    except requests.HTTPError as e:
+        data = await parse_page_a(y, m, d)
+    except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=502, detail=f"Upstream HTTP error: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=502, detail=f"Upstream request failed: {str(e)}") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Parse error: {str(e)}") from e
 
     if meal is not None:
-        meal = meal.strip()
-        if meal not in ("조식", "중식", "석식"):
-            raise HTTPException(status_code=400, detail="meal must be one of: 조식, 중식, 석식")
-        return {"date": f"{y:04d}-{m:02d}-{d:02d}", "meal": meal, "items": data.get(meal, [])}
+        return {"date": iso, "meal": meal.value, "items": data.get(meal.value, [])}
 
     return {
-        "date": f"{y:04d}-{m:02d}-{d:02d}",
-        "meals": {"조식": data.get("조식", []), "중식": data.get("중식", []), "석식": data.get("석식", [])},
+        "date": iso,
+        "meals": {k: data.get(k, []) for k in A_MEAL_KEYS},
     }
 
 
 # ---- meals-B (신규: 요일별 요청) ----
 @app.get("/meals-b")
-def get_meals_b(
-    day: str = Query(..., description="요일 (mon|tue|wed|thu|fri|sat|sun)"),
+async def get_meals_b(
+    day: Day = Query(..., description="요일 (mon|tue|wed|thu|fri|sat|sun)"),
 ):
-    day = day.strip().lower()
-    if day not in DAY_TO_DIV_ID:
-        raise HTTPException(status_code=400, detail="day must be one of: mon, tue, wed, thu, fri, sat, sun")
-
     try:
-        parsed_date, meals = parse_page_b(day)
-    except requests.HTTPError as e:
+        parsed_date, meals = await parse_page_b(day.value)
+    except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=502, detail=f"Upstream HTTP error: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=502, detail=f"Upstream request failed: {str(e)}") from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Parse error: {str(e)}") from e
 
     payload = {
         "source": "B",
-        "day": day,
+        "day": day.value,
         "cafeteria": "교직원 식당",
         "date": parsed_date,
-        "meals": {
-            "아침": meals.get("아침", []),
-            "점심": meals.get("점심", []),
-            "저녁": meals.get("저녁", []),
-        },
+        "meals": {k: meals.get(k, []) for k in B_MEAL_KEYS},
     }
 
     if not any(payload["meals"].values()):